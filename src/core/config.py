@@ -29,7 +29,7 @@ from typing import Optional, List, Union, Literal
 import json
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import BaseModel, ValidationError, Field
+from pydantic import BaseModel, ConfigDict, ValidationError, Field
 
 
 class AgentSettings(BaseSettings):
@@ -82,11 +82,17 @@ class AgentSettings(BaseSettings):
 
 
 class BearerAuthConfig(BaseModel):
+    # Frozen (hence hashable) so it can key the auth handler and client caches
+    model_config = ConfigDict(frozen=True)
+
     api_key_env_var: str
     method: Literal["bearer"] = "bearer"
 
 
 class OAuth2ClientCredentialsConfig(BaseModel):
+    # Frozen (hence hashable) so it can key the auth handler and client caches
+    model_config = ConfigDict(frozen=True)
+
     token_url: str
     client_id_env_var: str
     client_secret_env_var: str
@@ -112,6 +118,7 @@ class MCPServiceConfig(BaseModel):
     )
     tool_mappings_file: Optional[str] = None
     port: int = 8000  # Default port
+    openapi_cache_enabled: bool = False  # Cache the parsed OpenAPI spec on disk
 
 
 class MCPServerSettings(BaseSettings):
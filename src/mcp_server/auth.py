@@ -50,6 +50,11 @@ class OAuth2ClientCredentialsAuth(httpx.Auth):
             self._access_token = None
             self._token_expiry_time = 0.0
 
+    def prefetch_token(self) -> None:
+        """Fetches a token ahead of the first request if none is valid yet."""
+        if not self._access_token or time.time() >= self._token_expiry_time:
+            self._get_new_token()
+
     def auth_flow(
         self, request: httpx.Request
     ) -> Generator[httpx.Request, httpx.Response, None]:
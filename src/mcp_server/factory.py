@@ -2,9 +2,14 @@
 Factory class for constructing and configuring the MCP server.
 """
 
+import asyncio
+import functools
 import json
 import logging
-from typing import Dict, Any
+import os
+import re
+from types import MappingProxyType
+from typing import Dict, Any, Tuple, Union
 
 from fastmcp import FastMCP
 from fastmcp.server.openapi import RouteMap, MCPType
@@ -12,10 +17,132 @@ from starlette.requests import Request
 from starlette.responses import PlainTextResponse
 import httpx  # Add this import for httpx.AsyncClient
 
-from ..core.config import MCPServiceConfig
+from ..core.config import (
+    BearerAuthConfig,
+    MCPServiceConfig,
+    OAuth2ClientCredentialsConfig,
+)
 from .openapi_loader import OpenAPILoader
 from .tool_transformer import ToolTransformer
 from .auth import create_auth_handler  # Import the new auth handler
+from .utils import load_json
+
+
+AuthConfigType = Union[BearerAuthConfig, OAuth2ClientCredentialsConfig]
+
+# Process-wide HTTP clients shared by every factory, keyed by
+# (base_url, auth configuration), with the number of factories using each one.
+_CLIENT_POOL: Dict[Tuple[str, AuthConfigType], httpx.AsyncClient] = {}
+_CLIENT_REFCOUNTS: Dict[Tuple[str, AuthConfigType], int] = {}
+
+# Process-wide authentication handlers, keyed by auth configuration
+_AUTH_HANDLERS: Dict[AuthConfigType, httpx.Auth] = {}
+
+# Operation keys of an OpenAPI Path Item object
+_HTTP_METHODS = frozenset(
+    {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
+)
+
+# Default headers of the API clients (read-only, copied by httpx)
+_BASE_HEADERS = MappingProxyType(
+    {
+        "User-Agent": "DataInclusion-MCP-Server/1.0",
+        "Accept": "application/json",
+    }
+)
+
+# Body of the /health endpoint response
+_HEALTH_BODY = b"OK"
+
+# Connection pool limits for the API clients: tool calls can fan out to the
+# same host, so allow more concurrent and keep-alive connections than httpx's
+# defaults.
+_CLIENT_LIMITS = httpx.Limits(
+    max_connections=200, max_keepalive_connections=100, keepalive_expiry=30.0
+)
+
+
+async def close_all() -> None:
+    """
+    Closes every pooled HTTP client, regardless of outstanding references.
+
+    Intended to be called once at process shutdown.
+    """
+    clients = list(_CLIENT_POOL.values())
+    _CLIENT_POOL.clear()
+    _CLIENT_REFCOUNTS.clear()
+    for client in clients:
+        await client.aclose()
+
+
+async def _health_check(_request: Request) -> PlainTextResponse:
+    """A simple health check endpoint."""
+    # A new response per request: Starlette responses are not meant to be shared
+    return PlainTextResponse(_HEALTH_BODY, status_code=200)
+
+
+def _get_auth_handler(
+    auth_config: AuthConfigType, logger: logging.Logger
+) -> httpx.Auth | None:
+    """
+    Returns the authentication handler for an auth configuration, memoized.
+
+    Auth configurations are frozen pydantic models, hence hashable by value:
+    factories built from equal configurations share the same handler and thus
+    its cached OAuth2 token. Failures are not cached: when no handler can be
+    created (e.g. missing API key), the next call tries again.
+
+    Args:
+        auth_config: The authentication configuration of the service.
+        logger: Logger instance for logging messages.
+
+    Returns:
+        httpx.Auth | None: The authentication handler, or None if it cannot
+        be created.
+    """
+    auth_handler = _AUTH_HANDLERS.get(auth_config)
+    if auth_handler is None:
+        auth_handler = create_auth_handler(auth_config, logger)
+        if auth_handler is not None:
+            _AUTH_HANDLERS[auth_config] = auth_handler
+    return auth_handler
+
+
+@functools.lru_cache(maxsize=8)
+def _read_mappings_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Reads and parses a tool mappings JSON file, memoized by path and mtime.
+
+    The mtime is part of the cache key so that an edited file is re-read.
+    Exceptions are not cached by `lru_cache`, so a missing or invalid file
+    is retried on the next call.
+
+    Args:
+        path: Path of the JSON mappings file.
+        mtime_ns: Modification time of the file, in nanoseconds.
+
+    Returns:
+        Dict[str, Any]: The parsed mappings.
+    """
+    with open(path, "rb") as f:
+        return load_json(f.read())
+
+
+@functools.lru_cache(maxsize=4096)
+def _compiled_route_pattern(path: str) -> re.Pattern[str]:
+    """
+    Returns the compiled, anchored regex matching exactly an OpenAPI route path.
+
+    FastMCP's RouteMap accepts compiled patterns, so compiling once here and
+    memoizing by path lets repeated builds reuse the same Pattern objects.
+
+    Args:
+        path: The OpenAPI route path (e.g. "/api/v1/structures").
+
+    Returns:
+        re.Pattern[str]: The compiled pattern "^<path>$".
+    """
+    return re.compile(f"^{path}$")
 
 
 class MCPFactory:
@@ -37,27 +164,91 @@ class MCPFactory:
         self.config = config
         self.logger = logger
         self.api_client = None
+        self._auth_handler = None
+        self._client_key = None
         self.openapi_spec = None
         self.http_routes = None
+        self._routes_by_opid = {}
         self.base_url = None
         self.op_id_to_mangled_name = {}
         self.tool_mappings = {}
+        self._transformer = None
 
     async def _load_openapi_spec(self) -> None:
         """
         Loads and parses the OpenAPI specification.
 
         This method uses OpenAPILoader to load the OpenAPI specification
-        and extract HTTP routes.
+        and extract HTTP routes, then indexes the routes by operation_id.
 
         Raises:
             Exception: If loading the specification fails.
         """
         self.logger.info("Loading OpenAPI specification...")
-        openapi_loader = OpenAPILoader(self.logger)
+        openapi_loader = OpenAPILoader(
+            self.logger, cache_enabled=self.config.openapi_cache_enabled
+        )
         self.openapi_spec, self.http_routes = await openapi_loader.load(
             self.config.openapi_path_or_url  # Use openapi_path_or_url
         )
+        self._routes_by_opid = {
+            route.operation_id: route
+            for route in self.http_routes
+            if route.operation_id
+        }
+
+    def _allowed_operation_ids(self) -> set[str] | None:
+        """
+        Returns the operation IDs exposed as tools, if the service restricts them.
+
+        Only the datainclusion service limits its tools to the mapped operations;
+        other services expose every route of their specification. An empty or
+        missing mappings file therefore exposes no datainclusion operation.
+
+        Returns:
+            set[str] | None: The mapped operation IDs (possibly empty), or None
+            if all operations are exposed.
+        """
+        if self.config.name == "datainclusion":
+            return set(self.tool_mappings)
+        return None
+
+    def _prune_openapi_spec(self) -> None:
+        """
+        Removes the operations that will not be exposed as tools from the spec.
+
+        FastMCP parses every path of the specification it is given, so the
+        operations whose operationId is not mapped are dropped beforehand, as
+        well as the paths left without any operation. Components are kept
+        intact since the remaining operations may reference them.
+        """
+        if not self.openapi_spec:
+            raise ValueError("OpenAPI specification not loaded")
+
+        allowed_op_ids = self._allowed_operation_ids()
+        if allowed_op_ids is None:
+            return
+
+        paths = self.openapi_spec.get("paths", {})
+        pruned_paths = {}
+        removed = 0
+        for path, path_item in paths.items():
+            kept_item = {}
+            for key, value in path_item.items():
+                if key not in _HTTP_METHODS:
+                    kept_item[key] = value  # parameters, summary, servers...
+                elif value.get("operationId") in allowed_op_ids:
+                    kept_item[key] = value
+                else:
+                    removed += 1
+            if _HTTP_METHODS.intersection(kept_item):
+                pruned_paths[path] = kept_item
+
+        self.openapi_spec["paths"] = pruned_paths
+        self.logger.info(
+            f"Pruned {removed} unmapped operations from the OpenAPI spec "
+            f"({len(pruned_paths)} paths kept)"
+        )
 
     def _determine_base_url(self) -> None:
         """
@@ -69,45 +260,122 @@ class MCPFactory:
         if not self.openapi_spec:
             raise ValueError("OpenAPI specification not loaded")
 
-        servers = self.openapi_spec.get("servers", [])
-        if (
-            servers
-            and isinstance(servers, list)
-            and len(servers) > 0
-            and "url" in servers[0]
-        ):
-            self.base_url = servers[0]["url"]
+        try:
+            self.base_url = self.openapi_spec["servers"][0]["url"]
             self.logger.info(f"Using base URL from OpenAPI spec: {self.base_url}")
-        else:
+        except (KeyError, IndexError, TypeError):
             self.base_url = "http://localhost:8000"  # Default if not found in spec
             self.logger.warning("No servers section found in OpenAPI spec.")
             self.logger.warning(f"Using default base URL: {self.base_url}")
 
-    def _create_api_client(self) -> None:
+    def _create_auth_handler(self) -> None:
+        """
+        Creates the authentication handler used by the HTTP API client.
+
+        It only depends on the service configuration, so it can be created
+        while the OpenAPI specification is being loaded.
         """
-        Creates the authenticated HTTP API client.
+        self.logger.info("Creating authentication handler...")
+        self._auth_handler = _get_auth_handler(self.config.auth, self.logger)
 
-        This method creates an HTTP client configured with the base URL
-        and appropriate authentication parameters.
+    async def _warm_up_auth_handler(self) -> None:
+        """
+        Creates the authentication handler and prefetches its token if it can.
+
+        Handlers exposing `prefetch_token()` (OAuth2) fetch their token here,
+        so the first tool call does not pay for the token round trip. A failed
+        prefetch is not fatal: the token is requested again on first use.
+        Only the blocking token request runs in a worker thread.
+        """
+        self._create_auth_handler()
+
+        prefetch_token = getattr(self._auth_handler, "prefetch_token", None)
+        if prefetch_token is None:
+            return
+        try:
+            await asyncio.to_thread(prefetch_token)
+        except Exception as e:
+            self.logger.warning(f"Could not prefetch authentication token: {e}")
+
+    async def _create_api_client(self) -> None:
+        """
+        Creates or reuses the authenticated HTTP API client.
+
+        Clients are pooled process-wide by base URL and authentication
+        configuration, so rebuilding a factory keeps the existing connection
+        pool (and its keep-alive connections) instead of opening a new one.
+        A factory holds at most one reference: the client it already holds is
+        kept as is, and a reference to another client is released first.
+        A pooled client created without authentication handler gets the
+        current one, so the handler retry in `_get_auth_handler` is not lost.
         """
         if not self.base_url:
             raise ValueError("Base URL not determined")
 
-        self.logger.info("Creating HTTP client with new authentication handler...")
-        auth_handler = create_auth_handler(self.config.auth, self.logger)
+        key = (self.base_url, self.config.auth)
+        pooled = _CLIENT_POOL.get(key)
+        auth_handler = self._auth_handler
+        if pooled is not None and pooled.auth is None and auth_handler is not None:
+            # Pooled before a handler could be created (e.g. API key unset):
+            # attach the handler now rather than keep an unauthenticated client
+            self.logger.info("Attaching authentication handler to pooled client")
+            pooled.auth = auth_handler
 
-        headers = {
-            "User-Agent": "DataInclusion-MCP-Server/1.0",
-            "Accept": "application/json",
-        }
+        if (
+            self._client_key == key
+            and _CLIENT_POOL.get(key) is self.api_client
+            and not self.api_client.is_closed
+        ):
+            return
+        await self._release_api_client()
 
-        self.api_client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=headers,
-            timeout=30.0,
-            auth=auth_handler,  # Pass the auth handler
-        )
-        self.logger.info("HTTP client created successfully with authentication.")
+        client = _CLIENT_POOL.get(key)
+        if client is not None and not client.is_closed:
+            self.logger.info(f"Reusing pooled HTTP client for {self.base_url}")
+        else:
+            self.logger.info("Creating HTTP client with new authentication handler...")
+
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=_BASE_HEADERS,
+                timeout=30.0,
+                auth=self._auth_handler,  # Pass the auth handler
+                # Limits and HTTP/2 must be set on the transport: httpx ignores
+                # the client-level arguments when a transport is provided.
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True, limits=_CLIENT_LIMITS, retries=1
+                ),
+            )
+            _CLIENT_POOL[key] = client
+            # A closed entry may still be referenced by other factories: keep
+            # their count so that their release does not close this client
+            _CLIENT_REFCOUNTS.setdefault(key, 0)
+            self.logger.info("HTTP client created successfully with authentication.")
+
+        _CLIENT_REFCOUNTS[key] += 1
+        self.api_client = client
+        self._client_key = key
+
+    async def _release_api_client(self) -> None:
+        """
+        Releases this factory's reference to the pooled HTTP client.
+
+        The client is closed and removed from the pool once no factory
+        references it anymore.
+        """
+        key = self._client_key
+        self.api_client = None
+        self._client_key = None
+        if key is None or key not in _CLIENT_REFCOUNTS:
+            return
+
+        _CLIENT_REFCOUNTS[key] -= 1
+        if _CLIENT_REFCOUNTS[key] <= 0:
+            del _CLIENT_REFCOUNTS[key]
+            client = _CLIENT_POOL.pop(key)
+            self.logger.info("Closing HTTP client...")
+            await client.aclose()
+            self.logger.info("HTTP client closed successfully")
 
     def _load_tool_mappings(self) -> Dict[str, Any]:
         """
@@ -123,8 +391,9 @@ class MCPFactory:
             return {}
 
         try:
-            with open(self.config.tool_mappings_file, "r", encoding="utf-8") as f:
-                mappings = json.load(f)
+            path = self.config.tool_mappings_file
+            # Copy so that callers never mutate the cached dictionary
+            mappings = dict(_read_mappings_cached(path, os.stat(path).st_mtime_ns))
             self.logger.info(
                 f"Loaded custom tool mappings from {self.config.tool_mappings_file}"
             )
@@ -170,25 +439,27 @@ class MCPFactory:
         # Configuration des routes MCP
         route_maps = []
         if self.config.name == "datainclusion":
-            allowed_op_ids = set(self.tool_mappings.keys())
-            for route in self.http_routes:
-                if route.operation_id in allowed_op_ids:
-                    route_maps.append(
-                        RouteMap(
-                            methods=[route.method],
-                            pattern=f"^{route.path}$",
-                            mcp_type=MCPType.TOOL,
-                        )
-                    )
+            # Iterate over the mapped operations only, in mapping file order
+            route_maps = [
+                RouteMap(
+                    methods=[route.method],
+                    pattern=_compiled_route_pattern(route.path),
+                    mcp_type=MCPType.TOOL,
+                )
+                for route in map(self._routes_by_opid.get, self.tool_mappings)
+                if route is not None
+            ]
+            # Anything the mappings do not cover is never exposed
             route_maps.append(RouteMap(mcp_type=MCPType.EXCLUDE))
 
-        # Création du transformer temporaire pour le callback
-        temp_transformer = ToolTransformer(
+        # Création du transformer, réutilisé pour le callback et la transformation
+        self._transformer = ToolTransformer(
             mcp_server=None,  # type: ignore # Sera défini après création du serveur
             http_routes=self.http_routes,
             custom_tool_names=self.tool_mappings,  # Use loaded mappings
             op_id_map=self.op_id_to_mangled_name,
             logger=self.logger,
+            routes_by_op_id=self._routes_by_opid,
         )
 
         # Création du serveur MCP
@@ -198,14 +469,12 @@ class MCPFactory:
             name=self.config.name,
             route_maps=route_maps,  # Pass the dynamically created route_maps
             auth=None,
-            mcp_component_fn=temp_transformer.discover_and_customize,
+            mcp_component_fn=self._transformer.discover_and_customize,
         )
+        self._transformer.mcp_server = mcp_server
 
         # Ajout de l'endpoint de santé
-        @mcp_server.custom_route("/health", methods=["GET"])
-        async def health_check(_request: Request) -> PlainTextResponse:
-            """A simple health check endpoint."""
-            return PlainTextResponse("OK", status_code=200)
+        mcp_server.custom_route("/health", methods=["GET"])(_health_check)
 
         self.logger.info(f"FastMCP server '{mcp_server.name}' created successfully!")
         self.logger.info("   - Custom GET-to-Tool mapping applied")
@@ -217,8 +486,8 @@ class MCPFactory:
         """
         Transforms the MCP tools.
 
-        This method uses ToolTransformer to apply custom transformations
-        to the generated MCP tools.
+        This method reuses the ToolTransformer created in `_create_mcp_server`
+        to apply custom transformations to the generated MCP tools.
 
         Args:
             mcp_server: Instance of the MCP server.
@@ -226,18 +495,11 @@ class MCPFactory:
         Raises:
             Exception: If tool transformation fails.
         """
-        if not self.http_routes:
-            raise ValueError("HTTP routes not loaded")
+        if not self._transformer or self._transformer.mcp_server is not mcp_server:
+            raise ValueError("Tool transformer not created for this MCP server")
 
         self.logger.info("Transforming tools...")
-        tool_transformer = ToolTransformer(
-            mcp_server=mcp_server,
-            http_routes=self.http_routes,
-            custom_tool_names=self.tool_mappings,  # Use loaded mappings
-            op_id_map=self.op_id_to_mangled_name,
-            logger=self.logger,
-        )
-        await tool_transformer.transform_tools()
+        await self._transformer.transform_tools()
 
     async def build(self) -> FastMCP:
         """
@@ -253,17 +515,32 @@ class MCPFactory:
             Exception: If any build step fails.
         """
         try:
-            # 1. Load custom tool mappings
-            self.tool_mappings = self._load_tool_mappings()
-
-            # 2. Load and parse the OpenAPI specification
-            await self._load_openapi_spec()
+            # 1-2. Load custom tool mappings and the OpenAPI specification
+            # concurrently, while the authentication handler is created and
+            # warmed up: the three steps are independent.
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    mappings_task = tg.create_task(
+                        asyncio.to_thread(self._load_tool_mappings)
+                    )
+                    tg.create_task(self._load_openapi_spec())
+                    tg.create_task(self._warm_up_auth_handler())
+            except ExceptionGroup as eg:
+                # Re-raise the original error rather than the group wrapper,
+                # after logging the other failures it would otherwise hide
+                for exc in eg.exceptions[1:]:
+                    self.logger.error(f"Additional build error: {exc!r}")
+                raise eg.exceptions[0] from None
+            self.tool_mappings = mappings_task.result()
+
+            # Drop the operations that will not become tools
+            self._prune_openapi_spec()
 
             # 3. Determine the base URL
             self._determine_base_url()
 
             # 4. Create the authenticated API client
-            self._create_api_client()
+            await self._create_api_client()
 
             # 5. Configure authentication
             # auth_provider = self._configure_auth()
@@ -278,15 +555,13 @@ class MCPFactory:
 
         except Exception as e:
             self.logger.error(f"Failed to build MCP server: {e}")
-            if self.api_client:
-                await self.api_client.aclose()
+            await self._release_api_client()
             raise
 
     async def cleanup(self) -> None:
         """
         Cleans up resources used by the factory.
+
+        The shared HTTP client is only closed when no other factory uses it.
         """
-        if self.api_client:
-            self.logger.info("Closing HTTP client...")
-            await self.api_client.aclose()
-            self.logger.info("HTTP client closed successfully")
+        await self._release_api_client()
@@ -5,14 +5,27 @@ Ce module contient la classe OpenAPILoader qui centralise la logique de chargeme
 et de pré-traitement des spécifications OpenAPI pour le serveur MCP.
 """
 
+import hashlib
 import json
 import logging
 import os  # Import os
 import pathlib  # Import pathlib
+import pickle
 from typing import List, Dict, Tuple
+import aiofiles
+import fastmcp
 import httpx
 from fastmcp.utilities.openapi import parse_openapi_to_http_routes, HTTPRoute
 
+from .utils import load_json
+
+# Répertoire du cache disque des spécifications OpenAPI déjà parsées
+OPENAPI_CACHE_DIR = pathlib.Path.home() / ".cache" / "mcp_server"
+
+# Version du pré-traitement appliqué par le loader (pagination, filtrage...).
+# À incrémenter à chaque modification de ce traitement pour invalider le cache.
+OPENAPI_CACHE_FORMAT = 2
+
 
 class OpenAPILoader:
     """
@@ -22,17 +35,19 @@ class OpenAPILoader:
     - Chargement de la spécification OpenAPI depuis une URL
     - Parsing des routes HTTP
     - Application des limites de pagination
+    - Mise en cache sur disque du résultat pour les démarrages suivants
     """
 
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, cache_enabled: bool = False):
         """
         Initialise le loader avec le logger et l'URL OpenAPI.
 
         Args:
             logger: Instance du logger pour enregistrer les messages
-            openapi_url: L'URL de la spécification OpenAPI à charger
+            cache_enabled: Active le cache disque de la spécification parsée
         """
         self.logger = logger
+        self.cache_enabled = cache_enabled
 
     async def load(self, openapi_path_or_url: str) -> Tuple[Dict, List[HTTPRoute]]:
         """
@@ -43,6 +58,13 @@ class OpenAPILoader:
         2. Parse la spécification en routes HTTP
         3. Applique les limites de pagination
 
+        Si le cache est activé et que la source n'a pas changé depuis le dernier
+        chargement (mtime pour un fichier, ETag/Last-Modified pour une URL),
+        le résultat est relu depuis le cache disque sans re-parsing.
+
+        Args:
+            openapi_path_or_url: Chemin local ou URL de la spécification
+
         Returns:
             Tuple[Dict, List[HTTPRoute]]: Un tuple contenant la spécification OpenAPI
             et la liste des routes HTTP parsées.
@@ -52,10 +74,20 @@ class OpenAPILoader:
             json.JSONDecodeError: Si la réponse n'est pas un JSON valide
             FileNotFoundError: Si le fichier local spécifié n'existe pas
         """
+        is_url = openapi_path_or_url.startswith(
+            "http://"
+        ) or openapi_path_or_url.startswith("https://")
+
+        cache_key = None
+        if self.cache_enabled:
+            cache_key = await self._compute_cache_key(openapi_path_or_url, is_url)
+            if cache_key:
+                cached = await self._read_cache(openapi_path_or_url, cache_key)
+                if cached is not None:
+                    return cached
+
         openapi_spec = {}
-        if openapi_path_or_url.startswith("http://") or openapi_path_or_url.startswith(
-            "https://"
-        ):
+        if is_url:
             self.logger.info(
                 f"Loading OpenAPI specification from URL: '{openapi_path_or_url}'..."
             )
@@ -64,7 +96,7 @@ class OpenAPILoader:
                 async with httpx.AsyncClient() as client:
                     response = await client.get(openapi_path_or_url)
                     response.raise_for_status()  # Lève une exception si le statut n'est pas 2xx
-                    openapi_spec = response.json()
+                    openapi_spec = load_json(response.content)
             except httpx.RequestError as e:
                 self.logger.error(
                     f"Failed to fetch OpenAPI specification from '{openapi_path_or_url}'."
@@ -87,8 +119,9 @@ class OpenAPILoader:
                     raise FileNotFoundError(
                         f"Local OpenAPI file not found at '{openapi_path_or_url}'"
                     )
-                with pathlib.Path(openapi_path_or_url).open("r", encoding="utf-8") as f:
-                    openapi_spec = json.load(f)
+                async with aiofiles.open(openapi_path_or_url, "rb") as f:
+                    data = await f.read()
+                openapi_spec = load_json(data)
             except FileNotFoundError as e:
                 self.logger.error(f"Failed to load local OpenAPI file. Details: {e}")
                 raise
@@ -115,8 +148,145 @@ class OpenAPILoader:
         self.logger.info("Applying pagination limits to data-listing endpoints...")
         openapi_spec = self._limit_page_size(openapi_spec, max_size=25)
 
+        if cache_key:
+            await self._write_cache(
+                openapi_path_or_url, cache_key, (openapi_spec, http_routes)
+            )
+
         return openapi_spec, http_routes
 
+    async def _compute_cache_key(
+        self,
+        openapi_path_or_url: str,
+        is_url: bool,
+    ) -> str | None:
+        """
+        Calcule la clé de validité du cache pour la source de la spécification.
+
+        Pour un fichier local, la clé repose sur `st_mtime_ns` et la taille du fichier.
+        Pour une URL, elle repose sur les en-têtes `ETag` ou `Last-Modified` obtenus
+        via une requête HEAD. La clé inclut aussi la version du pré-traitement du
+        loader (`OPENAPI_CACHE_FORMAT`), la version de fastmcp (les routes HTTP
+        mises en cache sont des objets fastmcp).
+
+        Args:
+            openapi_path_or_url: Chemin local ou URL de la spécification
+            is_url: Indique si la source est une URL
+
+        Returns:
+            str | None: La clé de cache, ou None si la source ne permet pas
+            de détecter un changement (le cache est alors ignoré)
+        """
+        if is_url:
+            try:
+                async with httpx.AsyncClient() as client:
+                    response = await client.head(openapi_path_or_url)
+                    response.raise_for_status()
+            except httpx.HTTPError as e:
+                self.logger.debug(f"OpenAPI cache disabled, HEAD request failed: {e}")
+                return None
+            validator = response.headers.get("ETag") or response.headers.get(
+                "Last-Modified"
+            )
+            if not validator:
+                self.logger.debug(
+                    "OpenAPI cache disabled, no ETag/Last-Modified header on "
+                    f"'{openapi_path_or_url}'"
+                )
+                return None
+        else:
+            try:
+                stat = os.stat(openapi_path_or_url)
+            except OSError:
+                return None
+            validator = f"{stat.st_mtime_ns}:{stat.st_size}"
+
+        return (
+            f"{OPENAPI_CACHE_FORMAT}|{fastmcp.__version__}|{openapi_path_or_url}"
+            f"|{validator}"
+        )
+
+    def _cache_file(self, openapi_path_or_url: str) -> pathlib.Path:
+        """
+        Retourne le chemin du fichier de cache associé à une source.
+
+        Args:
+            openapi_path_or_url: Chemin local ou URL de la spécification
+
+        Returns:
+            pathlib.Path: Chemin du fichier pickle de cache
+        """
+        digest = hashlib.sha1(openapi_path_or_url.encode("utf-8")).hexdigest()
+        return OPENAPI_CACHE_DIR / f"openapi-{digest}.pkl"
+
+    async def _read_cache(
+        self, openapi_path_or_url: str, cache_key: str
+    ) -> Tuple[Dict, List[HTTPRoute]] | None:
+        """
+        Relit la spécification et les routes depuis le cache disque.
+
+        Args:
+            openapi_path_or_url: Chemin local ou URL de la spécification
+            cache_key: Clé de validité attendue
+
+        Returns:
+            Tuple[Dict, List[HTTPRoute]] | None: Le contenu mis en cache, ou None
+            si le cache est absent, périmé ou illisible
+        """
+        cache_file = self._cache_file(openapi_path_or_url)
+        try:
+            async with aiofiles.open(cache_file, "rb") as f:
+                stored_key, payload = pickle.loads(await f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(
+                f"Ignoring unreadable OpenAPI cache '{cache_file}': {e}"
+            )
+            return None
+
+        if stored_key != cache_key:
+            self.logger.info("OpenAPI cache is stale, reloading specification...")
+            return None
+
+        openapi_spec, http_routes = payload
+
+        self.logger.info(
+            f"Loaded OpenAPI spec and {len(http_routes)} HTTP routes from cache "
+            f"'{cache_file}'"
+        )
+        return openapi_spec, http_routes
+
+    async def _write_cache(
+        self,
+        openapi_path_or_url: str,
+        cache_key: str,
+        payload: Tuple[Dict, List[HTTPRoute]],
+    ) -> None:
+        """
+        Écrit la spécification et les routes parsées dans le cache disque.
+
+        L'écriture passe par un fichier temporaire puis un `os.replace` afin
+        qu'un lecteur concurrent ne voie jamais un fichier partiellement écrit.
+        Une erreur d'écriture n'est pas bloquante.
+
+        Args:
+            openapi_path_or_url: Chemin local ou URL de la spécification
+            cache_key: Clé de validité à associer au contenu
+            payload: La spécification OpenAPI et la liste des routes HTTP
+        """
+        cache_file = self._cache_file(openapi_path_or_url)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            async with aiofiles.open(tmp_file, "wb") as f:
+                await f.write(pickle.dumps((cache_key, payload), protocol=5))
+            os.replace(tmp_file, cache_file)
+            self.logger.info(f"OpenAPI spec cached to '{cache_file}'")
+        except Exception as e:
+            self.logger.warning(f"Could not write OpenAPI cache '{cache_file}': {e}")
+            tmp_file.unlink(missing_ok=True)
+
     def _limit_page_size(self, spec: dict, max_size: int = 25) -> dict:
         """
         Modifie la spécification OpenAPI pour limiter la taille des pages.
@@ -6,12 +6,10 @@ Il transforme automatiquement les endpoints OpenAPI en outils MCP.
 """
 
 import asyncio
-from starlette.requests import Request
-from starlette.responses import PlainTextResponse
 
 from ..core.config import settings
 from ..core.logging import setup_logging
-from .factory import MCPFactory
+from .factory import MCPFactory, close_all
 
 
 async def main():
@@ -46,18 +44,6 @@ async def main():
             service_mcp_instance = await factory.build()
             active_servers.append(service_mcp_instance)
 
-            # Add a health check endpoint to each individual service MCP instance
-            async def health_check(_request: Request) -> PlainTextResponse:
-                """A simple health check endpoint for the individual service."""
-                return PlainTextResponse("OK", status_code=200)
-
-            service_mcp_instance.custom_route("/health", methods=["GET"])(health_check)
-
-            logger.info(
-                "Health check endpoint (/health) added to service '%s'.",
-                service_config.name,
-            )
-
             server_url = (
                 f"http://{settings.mcp_server.MCP_HOST}:{service_config.port}"
                 f"{settings.mcp_server.MCP_API_PATH}"
@@ -106,6 +92,7 @@ async def main():
                         server.name,
                         close_e,
                     )
+        await close_all()
         logger.info("MCP Servers cleanup completed.")
 
 
@@ -23,7 +23,7 @@ from fastmcp.tools.tool_transform import ArgTransform
 from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.openapi import HTTPRoute
 
-from .utils import find_route_by_id, clean_json_schema
+from .utils import clean_json_schema
 
 
 class ToolTransformer:
@@ -42,6 +42,7 @@ class ToolTransformer:
         custom_tool_names: dict[str, str],
         op_id_map: dict[str, str],
         logger: logging.Logger,
+        routes_by_op_id: dict[str, HTTPRoute] | None = None,
     ):
         """
         Initialise le transformateur d'outils avec les paramètres nécessaires.
@@ -52,12 +53,19 @@ class ToolTransformer:
             custom_tool_names: Mapping des operation_ids vers les noms d'outils personnalisés
             op_id_map: Mapping des operation_ids vers les noms d'outils générés par FastMCP
             logger: Instance du logger pour enregistrer le processus de transformation
+            routes_by_op_id: Index des routes HTTP par operation_id (construit à partir
+                de http_routes s'il n'est pas fourni)
         """
         self.mcp_server = mcp_server
         self.http_routes = http_routes
         self.custom_tool_names = custom_tool_names
         self.op_id_map = op_id_map
         self.logger = logger
+        if routes_by_op_id is None:
+            routes_by_op_id = {
+                route.operation_id: route for route in http_routes if route.operation_id
+            }
+        self.routes_by_op_id = routes_by_op_id
 
     def discover_and_customize(
         self,
@@ -200,7 +208,7 @@ class ToolTransformer:
             ou (None, None) si non trouvé
         """
         # Rechercher la route correspondante dans les données OpenAPI
-        route = await find_route_by_id(original_name, self.http_routes)
+        route = self.routes_by_op_id.get(original_name)
         if route is None:
             self.logger.warning(
                 f"  ✗ Route not found for operation_id: '{original_name}' - skipping transformation"
@@ -380,22 +388,21 @@ class ToolTransformer:
 
         # Vérifier que nous avons encore des outils après transformation
         final_tools = await self.mcp_server.get_tools()
-        enabled_tools = [name for name, tool in final_tools.items() if tool.enabled]
+        enabled_count = sum(1 for tool in final_tools.values() if tool.enabled)
         self.logger.info(
-            f"📊 Final tool count: {len(enabled_tools)} enabled tools available"
+            f"📊 Final tool count: {enabled_count} enabled tools available"
         )
 
         # === DEBUG: AFFICHER LES OPERATION_IDS DISPONIBLES ===
         # Afficher les operation_ids non mappés pour aider au debug
         self.logger.info("=== OpenAPI Route Analysis ===")
-        available_ops = [
-            route.operation_id
-            for route in self.http_routes
-            if hasattr(route, "operation_id") and route.operation_id
-        ]
-        unmapped_ops = [
+        # filter(None, ...) écarte les operation_ids vides en un seul passage
+        available_ops = list(
+            filter(None, (route.operation_id for route in self.http_routes))
+        )
+        unmapped_ops = sorted(
             op_id for op_id in available_ops if op_id not in self.custom_tool_names
-        ]
+        )
 
         self.logger.info(f"Total OpenAPI routes: {len(available_ops)}")
         self.logger.info(f"Mapped routes: {len(self.custom_tool_names)}")
@@ -405,5 +412,5 @@ class ToolTransformer:
             self.logger.info(
                 "⚠️  Unmapped operation_ids (should be added to custom_mcp_tool_names):"
             )
-            for op_id in sorted(unmapped_ops):
+            for op_id in unmapped_ops:
                 self.logger.info(f"  - '{op_id}'")
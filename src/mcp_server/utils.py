@@ -2,8 +2,32 @@
 Utility functions for the MCP server.
 """
 
+import json
 import logging
-from fastmcp.utilities.openapi import HTTPRoute
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Repli sur le module json standard si orjson est absent
+    orjson = None
+
+
+def load_json(data: bytes | str) -> Any:
+    """Décode un document JSON avec orjson s'il est disponible, sinon avec json.
+
+    Args:
+        data: Le document JSON brut (bytes ou str)
+
+    Returns:
+        Any: L'objet Python décodé
+
+    Raises:
+        json.JSONDecodeError: Si le document n'est pas un JSON valide
+            (`orjson.JSONDecodeError` en est une sous-classe)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def deep_clean_schema(schema: dict) -> None:
@@ -43,29 +67,6 @@ def deep_clean_schema(schema: dict) -> None:
         del schema[key]
 
 
-async def find_route_by_id(
-    operation_id: str, routes: list[HTTPRoute]
-) -> HTTPRoute | None:
-    """
-    Recherche un objet HTTPRoute par son operation_id.
-
-    Cette fonction parcourt une liste d'objets HTTPRoute et retourne le premier
-    objet dont l'attribut operation_id correspond à l'operation_id fourni.
-
-    Args:
-        operation_id: L'identifiant d'opération à rechercher
-        routes: La liste des objets HTTPRoute à parcourir
-
-    Returns:
-        HTTPRoute | None: L'objet HTTPRoute correspondant ou None si aucune "
-        "correspondance n'est trouvée
-    """
-    for route in routes:
-        if hasattr(route, "operation_id") and route.operation_id == operation_id:
-            return route
-    return None
-
-
 def clean_json_schema(component, logger: logging.Logger):
     """
     Simplifie les schémas d'un composant pour une meilleure compatibilité avec les LLMs stricts.